@@ -7,6 +7,7 @@ import pytest
 pytestmark = [pytest.mark.integration, pytest.mark.cli]
 from unittest.mock import patch, Mock
 from copy import deepcopy
+import json
 import sys
 from tokyoweather.__main__ import main
 from tokyoweather.weather import WeatherAPIError
@@ -73,74 +74,38 @@ class TestCLIMain:
     @patch("tokyoweather.__main__.fetch_weather")
     @patch("tokyoweather.__main__.format_jst_time")
     @patch.dict("os.environ", {"OPENWEATHER_API_KEY": "test_key"})
-    def test_main_weather_api_error(self, mock_format_time, mock_fetch, capsys):
-        """Test main function with weather API error."""
-        # Setup mocks
-        mock_format_time.return_value = "2025-11-19 15:42:07 JST"
-        mock_fetch.side_effect = WeatherAPIError("Failed to connect to weather service")
-        
-        # Run main
-        exit_code = main()
-        
-        # Verify exit code
-        assert exit_code == 2
-        
-        # Verify output
-        captured = capsys.readouterr()
-        assert "Tokyo Time: 2025-11-19 15:42:07 JST" in captured.out
-        assert "ERROR: Failed to fetch weather data" in captured.err
-        assert "Failed to connect to weather service" in captured.err
-    
-    @patch("tokyoweather.__main__.fetch_weather")
-    @patch("tokyoweather.__main__.format_jst_time")
-    @patch.dict("os.environ", {"OPENWEATHER_API_KEY": "invalid_key"})
-    def test_main_invalid_api_key(self, mock_format_time, mock_fetch, capsys):
-        """Test main function with invalid API key."""
-        # Setup mocks
-        mock_format_time.return_value = "2025-11-19 15:42:07 JST"
-        mock_fetch.side_effect = WeatherAPIError("Invalid API key")
-        
-        # Run main
-        exit_code = main()
-        
-        # Verify exit code
-        assert exit_code == 2
-        
-        # Verify output
-        captured = capsys.readouterr()
-        assert "Tokyo Time: 2025-11-19 15:42:07 JST" in captured.out
-        assert "ERROR: Failed to fetch weather data" in captured.err
-        assert "Invalid API key" in captured.err
-    
-    @patch("tokyoweather.__main__.fetch_weather")
-    @patch("tokyoweather.__main__.format_jst_time")
-    @patch.dict("os.environ", {"OPENWEATHER_API_KEY": "test_key"})
-    def test_main_network_timeout(self, mock_format_time, mock_fetch, capsys):
-        """Test main function with network timeout."""
-        # Setup mocks
+    def test_main_json_output(self, mock_format_time, mock_fetch, capsys):
+        """Test that --json prints only the weather as a JSON object."""
         mock_format_time.return_value = "2025-11-19 15:42:07 JST"
-        mock_fetch.side_effect = WeatherAPIError("Request timed out after 10 seconds")
+        mock_fetch.return_value = SAMPLE_WEATHER_DATA
         
-        # Run main
-        exit_code = main()
+        exit_code = main(["--json"])
         
-        # Verify exit code
-        assert exit_code == 2
-        
-        # Verify output
+        assert exit_code == 0
         captured = capsys.readouterr()
-        assert "Tokyo Time: 2025-11-19 15:42:07 JST" in captured.out
-        assert "ERROR: Failed to fetch weather data" in captured.err
-        assert "timed out" in captured.err
+        assert "Tokyo Time:" not in captured.out
+        assert json.loads(captured.out) == {
+            "description": "clear sky",
+            "temperature": 18.2,
+            "humidity": 55,
+            "wind_speed": 3.4,
+        }
     
+    @pytest.mark.parametrize("error_message, expected_substr", [
+        ("Failed to connect to weather service", "Failed to connect to weather service"),
+        ("Invalid API key", "Invalid API key"),
+        ("Request timed out after 10 seconds", "timed out"),
+        ("City 'Tokyo' not found", "not found"),
+    ], ids=["connection_error", "invalid_api_key", "network_timeout", "city_not_found"])
     @patch("tokyoweather.__main__.fetch_weather")
     @patch("tokyoweather.__main__.format_jst_time")
     @patch.dict("os.environ", {"OPENWEATHER_API_KEY": "test_key"})
-    def test_main_city_not_found(self, mock_format_time, mock_fetch, capsys):
-        """Test main function with city not found error."""
+    def test_main_weather_api_error(self, mock_format_time, mock_fetch, capsys,
+                                    error_message, expected_substr):
+        """Test main function when the weather API call fails."""
         # Setup mocks
         mock_format_time.return_value = "2025-11-19 15:42:07 JST"
-        mock_fetch.side_effect = WeatherAPIError("City 'Tokyo' not found")
+        mock_fetch.side_effect = WeatherAPIError(error_message)
         
         # Run main
         exit_code = main()
@@ -152,59 +117,60 @@ class TestCLIMain:
         captured = capsys.readouterr()
         assert "Tokyo Time: 2025-11-19 15:42:07 JST" in captured.out
         assert "ERROR: Failed to fetch weather data" in captured.err
-        assert "not found" in captured.err
+        assert expected_substr in captured.err
 
 
 class TestEnvironmentVariableHandling:
     """Tests for environment variable handling and security."""
     
-    @patch("tokyoweather.__main__.format_jst_time")
-    @patch.dict("os.environ", {}, clear=True)
-    def test_missing_env_var_returns_exit_code_1(self, mock_format_time, capsys):
-        """Test that missing API key returns exit code 1 (config error)."""
-        mock_format_time.return_value = "2025-11-19 15:42:07 JST"
-        
-        exit_code = main()
-        
-        assert exit_code == 1
-        captured = capsys.readouterr()
-        assert "ERROR: OPENWEATHER_API_KEY environment variable not set" in captured.err
+    @pytest.fixture(autouse=True)
+    def mock_format_time(self):
+        """Patch format_jst_time with a fixed timestamp for every test in this class."""
+        with patch("tokyoweather.__main__.format_jst_time") as mock_format_time:
+            mock_format_time.return_value = "2025-11-19 15:42:07 JST"
+            yield mock_format_time
     
-    @patch("tokyoweather.__main__.format_jst_time")
-    @patch.dict("os.environ", {"OPENWEATHER_API_KEY": ""})
-    def test_empty_env_var_returns_exit_code_1(self, mock_format_time, capsys):
-        """Test that empty API key is treated as missing."""
-        mock_format_time.return_value = "2025-11-19 15:42:07 JST"
+    @pytest.mark.parametrize("env_value", [None, "", "   "],
+                             ids=["unset", "empty", "whitespace_only"])
+    @patch("tokyoweather.__main__.fetch_weather")
+    def test_missing_api_key_returns_exit_code_1(self, mock_fetch, env_value, monkeypatch, capsys):
+        """Test that an unset, empty or whitespace-only API key returns exit code 1."""
+        if env_value is None:
+            monkeypatch.delenv("OPENWEATHER_API_KEY", raising=False)
+        else:
+            monkeypatch.setenv("OPENWEATHER_API_KEY", env_value)
         
         exit_code = main()
         
         assert exit_code == 1
         captured = capsys.readouterr()
         assert "ERROR: OPENWEATHER_API_KEY environment variable not set" in captured.err
+        
+        # No network request should be attempted without a usable key
+        mock_fetch.assert_not_called()
     
     @patch("tokyoweather.__main__.fetch_weather")
-    @patch("tokyoweather.__main__.format_jst_time")
-    @patch.dict("os.environ", {"OPENWEATHER_API_KEY": "   "})
-    def test_whitespace_only_env_var_returns_exit_code_1(self, mock_format_time, mock_fetch, capsys):
-        """Test that whitespace-only API key is treated as missing."""
-        mock_format_time.return_value = "2025-11-19 15:42:07 JST"
+    @patch("tokyoweather.__main__.load_dotenv")
+    @patch("tokyoweather.__main__._DOTENV_LOADED", False)
+    @patch.dict("os.environ", {"OPENWEATHER_API_KEY": "valid_key"})
+    def test_dotenv_loaded_at_startup(self, mock_load_dotenv, mock_fetch, capsys):
+        """Test that load_dotenv is called to load .env file."""
+        mock_fetch.return_value = SAMPLE_WEATHER_DATA
         
-        exit_code = main()
+        main()
         
-        assert exit_code == 1
-        captured = capsys.readouterr()
-        assert "ERROR: OPENWEATHER_API_KEY environment variable not set" in captured.err
+        # Verify load_dotenv was called
+        mock_load_dotenv.assert_called_once()
     
     @patch("tokyoweather.__main__.fetch_weather")
-    @patch("tokyoweather.__main__.format_jst_time")
     @patch("tokyoweather.__main__.load_dotenv")
+    @patch("tokyoweather.__main__._DOTENV_LOADED", False)
     @patch.dict("os.environ", {"OPENWEATHER_API_KEY": "valid_key"})
-    def test_dotenv_loaded_at_startup(self, mock_load_dotenv, mock_format_time, mock_fetch, capsys):
-        """Test that load_dotenv is called to load .env file."""
-        mock_format_time.return_value = "2025-11-19 15:42:07 JST"
+    def test_dotenv_loaded_only_once(self, mock_load_dotenv, mock_fetch, capsys):
+        """Test that repeated main() calls do not reload the .env file."""
         mock_fetch.return_value = SAMPLE_WEATHER_DATA
         
+        main()
         main()
         
-        # Verify load_dotenv was called
         mock_load_dotenv.assert_called_once()
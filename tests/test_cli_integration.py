@@ -1,7 +1,9 @@
 """
-Integration tests for CLI execution as subprocess.
+Integration tests for CLI execution.
 
-These tests execute the CLI as a real subprocess to test end-to-end functionality.
+A few tests execute the CLI as a real subprocess to test end-to-end
+functionality; the remaining checks call main() in-process to avoid paying
+for an interpreter start-up per test.
 """
 
 import pytest
@@ -9,8 +11,10 @@ import subprocess
 import sys
 import os
 from pathlib import Path
+from unittest.mock import patch
+from tokyoweather.__main__ import main
 
-pytestmark = [pytest.mark.integration, pytest.mark.cli, pytest.mark.slow]
+pytestmark = [pytest.mark.integration, pytest.mark.cli]
 
 
 @pytest.fixture
@@ -25,9 +29,17 @@ def cli_command(project_root):
     return [sys.executable, "-m", "tokyoweather"]
 
 
+@pytest.fixture
+def no_dotenv():
+    """Keep in-process main() calls from loading the developer's real .env file."""
+    with patch("tokyoweather.__main__.load_dotenv") as mock_load_dotenv:
+        yield mock_load_dotenv
+
+
 class TestCLISubprocess:
     """Tests for CLI execution as subprocess."""
     
+    @pytest.mark.slow
     def test_cli_runs_without_api_key(self, cli_command, project_root):
         """Test CLI execution without API key shows appropriate error."""
         # Run CLI without API key
@@ -69,6 +81,7 @@ class TestCLISubprocess:
         from tokyoweather.__main__ import main
         assert callable(main), "main function should be callable"
     
+    @pytest.mark.slow
     def test_cli_help_with_python_module(self, cli_command, project_root):
         """Test that CLI can be run with python -m tokyoweather."""
         result = subprocess.run(
@@ -84,6 +97,7 @@ class TestCLISubprocess:
         # This test just verifies the CLI can be invoked
         assert result.returncode != 0 or "Tokyo Time:" in result.stdout
     
+    @pytest.mark.slow
     @pytest.mark.skip(reason="Requires valid API key and network access")
     def test_cli_with_valid_api_key(self, cli_command, project_root):
         """Test CLI execution with valid API key (requires real API key)."""
@@ -118,89 +132,53 @@ class TestCLISubprocess:
         assert "Wind:" in result.stdout
 
 
+@pytest.mark.usefixtures("no_dotenv")
 class TestCLIExitCodes:
     """Tests for CLI exit codes."""
     
-    def test_missing_api_key_exit_code_1(self, cli_command, project_root):
+    def test_missing_api_key_exit_code_1(self, monkeypatch):
         """Test that missing API key returns exit code 1 (configuration error)."""
-        env = os.environ.copy()
-        env.pop("OPENWEATHER_API_KEY", None)
-        
-        result = subprocess.run(
-            cli_command,
-            cwd=project_root,
-            capture_output=True,
-            text=True,
-            env=env
-        )
+        monkeypatch.delenv("OPENWEATHER_API_KEY", raising=False)
         
-        assert result.returncode == 1, "Missing API key should return exit code 1"
+        assert main() == 1, "Missing API key should return exit code 1"
     
-    def test_empty_api_key_exit_code_1(self, cli_command, project_root):
+    def test_empty_api_key_exit_code_1(self, monkeypatch):
         """Test that empty API key returns exit code 1 (configuration error)."""
-        env = os.environ.copy()
-        env["OPENWEATHER_API_KEY"] = ""
-        
-        result = subprocess.run(
-            cli_command,
-            cwd=project_root,
-            capture_output=True,
-            text=True,
-            env=env
-        )
+        monkeypatch.setenv("OPENWEATHER_API_KEY", "")
         
-        assert result.returncode == 1, "Empty API key should return exit code 1"
+        assert main() == 1, "Empty API key should return exit code 1"
     
-    def test_whitespace_api_key_exit_code_1(self, cli_command, project_root):
+    def test_whitespace_api_key_exit_code_1(self, monkeypatch):
         """Test that whitespace-only API key returns exit code 1."""
-        env = os.environ.copy()
-        env["OPENWEATHER_API_KEY"] = "   "
-        
-        result = subprocess.run(
-            cli_command,
-            cwd=project_root,
-            capture_output=True,
-            text=True,
-            env=env
-        )
+        monkeypatch.setenv("OPENWEATHER_API_KEY", "   ")
         
-        assert result.returncode == 1, "Whitespace API key should return exit code 1"
+        assert main() == 1, "Whitespace API key should return exit code 1"
 
 
+@pytest.mark.usefixtures("no_dotenv")
 class TestCLIOutput:
     """Tests for CLI output formatting."""
     
-    def test_output_includes_timestamp(self, cli_command, project_root):
+    def test_output_includes_timestamp(self, monkeypatch, capsys):
         """Test that CLI output includes a JST timestamp."""
-        env = os.environ.copy()
-        env.pop("OPENWEATHER_API_KEY", None)
+        monkeypatch.delenv("OPENWEATHER_API_KEY", raising=False)
         
-        result = subprocess.run(
-            cli_command,
-            cwd=project_root,
-            capture_output=True,
-            text=True,
-            env=env
-        )
+        main()
+        captured = capsys.readouterr()
         
         # Even without API key, time should be displayed
-        assert "Tokyo Time:" in result.stdout
-        assert "JST" in result.stdout
+        assert "Tokyo Time:" in captured.out
+        assert "JST" in captured.out
     
-    def test_stderr_for_errors(self, cli_command, project_root):
+    def test_stderr_for_errors(self, monkeypatch, capsys):
         """Test that errors are written to stderr, not stdout."""
-        env = os.environ.copy()
-        env.pop("OPENWEATHER_API_KEY", None)
+        monkeypatch.delenv("OPENWEATHER_API_KEY", raising=False)
         
-        result = subprocess.run(
-            cli_command,
-            cwd=project_root,
-            capture_output=True,
-            text=True,
-            env=env
-        )
+        main()
+        captured = capsys.readouterr()
         
         # Error messages should be in stderr
-        assert "ERROR:" in result.stderr
+        assert "ERROR:" in captured.err
+        assert "ERROR:" not in captured.out
         # Success output (time) should be in stdout
-        assert "Tokyo Time:" in result.stdout
+        assert "Tokyo Time:" in captured.out
@@ -5,8 +5,9 @@ Unit tests for time_utils module.
 import pytest
 
 pytestmark = pytest.mark.unit
+from unittest.mock import patch
 from datetime import datetime, timezone, timedelta
-from tokyoweather.time_utils import get_jst_time, format_jst_time
+from tokyoweather.time_utils import JST, get_jst_time, format_jst_time
 
 
 def test_get_jst_time():
@@ -21,14 +22,21 @@ def test_get_jst_time():
     assert jst_time.utcoffset() == expected_offset
 
 
-def test_get_jst_time_is_current():
-    """Test that get_jst_time returns approximately current time."""
-    before = datetime.now(timezone(timedelta(hours=9)))
-    jst_time = get_jst_time()
-    after = datetime.now(timezone(timedelta(hours=9)))
+def test_get_jst_time_reuses_shared_tzinfo():
+    """Test that get_jst_time uses the module-level JST tzinfo instead of building one per call."""
+    assert get_jst_time().tzinfo is JST
+    assert get_jst_time().tzinfo is get_jst_time().tzinfo
+
+
+@patch("tokyoweather.time_utils.datetime")
+def test_get_jst_time_is_current(mock_datetime):
+    """Test that get_jst_time returns the current time in JST."""
+    jst = timezone(timedelta(hours=9))
+    fixed_now = datetime(2025, 11, 19, 15, 42, 7, tzinfo=jst)
+    mock_datetime.now.return_value = fixed_now
     
-    # The returned time should be between before and after
-    assert before <= jst_time <= after
+    assert get_jst_time() == fixed_now
+    mock_datetime.now.assert_called_once_with(jst)
 
 
 def test_format_jst_time_with_no_argument():
@@ -69,3 +77,16 @@ def test_format_jst_time_handles_different_times():
     # Test late evening
     test_dt = datetime(2025, 12, 31, 23, 59, 59, tzinfo=jst)
     assert format_jst_time(test_dt) == "2025-12-31 23:59:59 JST"
+
+
+def test_format_jst_time_matches_strftime():
+    """Test that the fast formatter matches the equivalent strftime output."""
+    samples = [
+        datetime(2025, 1, 2, 3, 4, 5, tzinfo=JST),
+        datetime(2025, 11, 19, 15, 42, 7, 999999, tzinfo=JST),
+        datetime(1999, 12, 31, 23, 59, 59, tzinfo=JST),
+        datetime(2025, 6, 15, 12, 30, 45),  # naive datetime
+    ]
+    
+    for dt in samples:
+        assert format_jst_time(dt) == dt.strftime("%Y-%m-%d %H:%M:%S JST")
@@ -6,12 +6,24 @@ import pytest
 
 pytestmark = [pytest.mark.unit, pytest.mark.api]
 from unittest.mock import patch, Mock
-from copy import deepcopy
+import asyncio
+import json
+from dataclasses import asdict
+import threading
+from types import MappingProxyType
+from urllib.parse import parse_qsl, urlsplit
 import requests
+from tokyoweather import weather
 from tokyoweather.weather import (
     fetch_weather,
+    fetch_weather_async,
+    fetch_weather_many,
+    fetch_weather_many_sync,
+    clear_weather_cache,
     _parse_weather_response,
     WeatherAPIError,
+    DEFAULT_TIMEOUT,
+    MAX_RESPONSE_BYTES,
     OPENWEATHER_API_BASE_URL,
     DEFAULT_CITY
 )
@@ -42,14 +54,67 @@ SAMPLE_API_RESPONSE = {
     },
     "name": "Tokyo"
 }
+SAMPLE_API_RESPONSE_JSON = json.dumps(SAMPLE_API_RESPONSE)
+
+
+def _read_only(value):
+    """Recursively wrap dicts in MappingProxyType and turn lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _read_only(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_read_only(v) for v in value)
+    return value
+
+
+# Tests that only read the sample share this view; tests that mutate it
+# take the api_response fixture instead
+SAMPLE_API_RESPONSE = _read_only(SAMPLE_API_RESPONSE)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty fetch_weather result cache."""
+    clear_weather_cache()
+    yield
+    clear_weather_cache()
+
+
+@pytest.fixture
+def api_response():
+    """Fresh copy of SAMPLE_API_RESPONSE that a test may freely mutate."""
+    return json.loads(SAMPLE_API_RESPONSE_JSON)
+
+
+def _mock_response(status_code=200, body=SAMPLE_API_RESPONSE_JSON.encode(),
+                   headers=None, reason="OK"):
+    """Build a mock streamed requests.Response whose body is ``body``."""
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.reason = reason
+    mock_response.headers = headers or {}
+    mock_response.iter_content.side_effect = lambda chunk_size: iter([body])
+    return mock_response
+
+
+def _query_params(args, kwargs):
+    """Return the query parameters of a mocked session.get() call as a dict."""
+    url = args[0] if args else kwargs["url"]
+    params = dict(parse_qsl(urlsplit(url).query))
+    params.update(kwargs.get("params") or ())
+    return params
+
+
+def _sent_params(mock_get):
+    """Return the query parameters of the last mocked session.get() call."""
+    return _query_params(*mock_get.call_args)
 
 
 class TestParseWeatherResponse:
     """Tests for _parse_weather_response function."""
     
-    def test_parse_valid_response(self):
+    def test_parse_valid_response(self, api_response):
         """Test parsing a valid API response."""
-        result = _parse_weather_response(deepcopy(SAMPLE_API_RESPONSE))
+        result = _parse_weather_response(api_response)
         
         assert isinstance(result, WeatherData)
         assert result.description == "clear sky"
@@ -57,9 +122,40 @@ class TestParseWeatherResponse:
         assert result.humidity == 55
         assert result.wind_speed == 3.4
     
-    def test_parse_rounds_values(self):
+    def test_parse_raw_data_excluded_from_repr_and_eq(self, api_response):
+        """Test that raw_data is kept but does not affect repr or equality."""
+        result = _parse_weather_response(api_response)
+        
+        assert result.raw_data is api_response
+        assert "raw_data" not in repr(result)
+        assert result == WeatherData("clear sky", 18.2, 55, 3.4)
+        assert hash(result) == hash(WeatherData("clear sky", 18.2, 55, 3.4))
+    
+    def test_parsed_weather_data_is_slotted(self, api_response):
+        """Test that WeatherData instances carry no per-instance __dict__."""
+        result = _parse_weather_response(api_response)
+        
+        assert not hasattr(result, "__dict__")
+    
+    def test_weather_data_asdict_has_only_declared_fields(self, api_response):
+        """Test that asdict() is stable and does not depend on earlier str() calls."""
+        result = _parse_weather_response(api_response, keep_raw=False)
+        before = asdict(result)
+        str(result)
+        
+        assert asdict(result) == before
+        assert list(before) == ["description", "temperature", "humidity", "wind_speed", "raw_data"]
+    
+    def test_parse_without_raw_data(self, api_response):
+        """Test that keep_raw=False leaves raw_data unset."""
+        result = _parse_weather_response(api_response, keep_raw=False)
+        
+        assert result.raw_data is None
+        assert result.description == "clear sky"
+    
+    def test_parse_rounds_values(self, api_response):
         """Test that temperature and wind speed are rounded."""
-        data = deepcopy(SAMPLE_API_RESPONSE)
+        data = api_response
         data["main"]["temp"] = 18.256
         data["wind"]["speed"] = 3.456
         
@@ -68,36 +164,61 @@ class TestParseWeatherResponse:
         assert result.temperature == 18.3
         assert result.wind_speed == 3.5
     
-    def test_parse_missing_weather_field(self):
+    def test_parse_missing_weather_field(self, api_response):
         """Test parsing fails when weather field is missing."""
-        data = deepcopy(SAMPLE_API_RESPONSE)
+        data = api_response
         del data["weather"]
         
         with pytest.raises(WeatherAPIError) as exc_info:
             _parse_weather_response(data)
         assert "Unexpected API response format" in str(exc_info.value)
     
-    def test_parse_empty_weather_list(self):
+    def test_parse_empty_weather_list(self, api_response):
         """Test parsing fails when weather list is empty."""
-        data = deepcopy(SAMPLE_API_RESPONSE)
+        data = api_response
         data["weather"] = []
         
         with pytest.raises(WeatherAPIError) as exc_info:
             _parse_weather_response(data)
         assert "weather list is empty" in str(exc_info.value)
     
-    def test_parse_missing_main_field(self):
+    def test_parse_missing_main_field(self, api_response):
         """Test parsing fails when main field is missing."""
-        data = deepcopy(SAMPLE_API_RESPONSE)
+        data = api_response
         del data["main"]
         
         with pytest.raises(WeatherAPIError) as exc_info:
             _parse_weather_response(data)
         assert "Unexpected API response format" in str(exc_info.value)
     
-    def test_parse_missing_wind_field(self):
+    def test_parse_missing_nested_field(self, api_response):
+        """Test that the error names a missing nested field."""
+        data = api_response
+        del data["main"]["humidity"]
+        
+        with pytest.raises(WeatherAPIError) as exc_info:
+            _parse_weather_response(data)
+        assert "missing field 'humidity'" in str(exc_info.value)
+    
+    def test_parse_wrong_field_type(self, api_response):
+        """Test parsing fails cleanly when a field has the wrong type."""
+        data = api_response
+        data["main"]["temp"] = "warm"
+        
+        with pytest.raises(WeatherAPIError) as exc_info:
+            _parse_weather_response(data)
+        assert "Unexpected API response format" in str(exc_info.value)
+    
+    @pytest.mark.parametrize("body", [[], None], ids=["list", "null"])
+    def test_parse_non_object_body(self, body):
+        """Test parsing fails cleanly when the JSON body is not an object."""
+        with pytest.raises(WeatherAPIError) as exc_info:
+            _parse_weather_response(body)
+        assert "expected a JSON object" in str(exc_info.value)
+    
+    def test_parse_missing_wind_field(self, api_response):
         """Test parsing fails when wind field is missing."""
-        data = deepcopy(SAMPLE_API_RESPONSE)
+        data = api_response
         del data["wind"]
         
         with pytest.raises(WeatherAPIError) as exc_info:
@@ -108,57 +229,158 @@ class TestParseWeatherResponse:
 class TestFetchWeather:
     """Tests for fetch_weather function."""
     
-    @patch("tokyoweather.weather.requests.get")
+    @patch("tokyoweather.weather._SESSION.get")
     def test_fetch_weather_success(self, mock_get):
         """Test successful weather fetch."""
         # Setup mock
-        mock_response = Mock()
-        mock_response.status_code = 200
-        # Use deepcopy to avoid side effects from other tests
-        mock_response.json.return_value = deepcopy(SAMPLE_API_RESPONSE)
-        mock_get.return_value = mock_response
+        mock_get.return_value = _mock_response()
         
         # Call function
         result = fetch_weather(api_key="test_key")
         
         # Verify request was made correctly
         mock_get.assert_called_once()
-        call_args = mock_get.call_args
-        assert call_args[0][0] == OPENWEATHER_API_BASE_URL
-        assert call_args[1]["params"]["q"] == DEFAULT_CITY
-        assert call_args[1]["params"]["appid"] == "test_key"
-        assert call_args[1]["params"]["units"] == "metric"
+        url = mock_get.call_args[0][0]
+        assert url.startswith(OPENWEATHER_API_BASE_URL + "?")
+        params = _sent_params(mock_get)
+        assert params["q"] == DEFAULT_CITY
+        assert params["appid"] == "test_key"
+        assert params["units"] == "metric"
         
         # Verify result
         assert isinstance(result, WeatherData)
         assert result.description == "clear sky"
         assert result.temperature == 18.2
     
-    @patch("tokyoweather.weather.requests.get")
+    @patch("tokyoweather.weather._SESSION.get")
     def test_fetch_weather_with_custom_city(self, mock_get):
         """Test fetch weather with custom city."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = deepcopy(SAMPLE_API_RESPONSE)
-        mock_get.return_value = mock_response
+        mock_get.return_value = _mock_response()
         
         fetch_weather(api_key="test_key", city="Osaka")
         
-        call_args = mock_get.call_args
-        assert call_args[1]["params"]["q"] == "Osaka"
+        assert _sent_params(mock_get)["q"] == "Osaka"
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_quotes_api_key(self, mock_get):
+        """Test that reserved characters in the API key are percent-encoded."""
+        mock_get.return_value = _mock_response()
+        
+        fetch_weather(api_key="a&b=c d")
+        
+        assert _sent_params(mock_get)["appid"] == "a&b=c d"
     
-    @patch("tokyoweather.weather.requests.get")
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_encodes_city_name(self, mock_get):
+        """Test that non-ASCII and spaced city names are URL-encoded."""
+        mock_get.return_value = _mock_response()
+        
+        fetch_weather(api_key="test_key", city="São Paulo")
+        
+        assert _sent_params(mock_get)["q"] == "São Paulo"
+        assert " " not in mock_get.call_args[0][0]
+    
+    @patch("tokyoweather.weather._SESSION.get")
     def test_fetch_weather_with_custom_units(self, mock_get):
         """Test fetch weather with custom units."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = deepcopy(SAMPLE_API_RESPONSE)
-        mock_get.return_value = mock_response
+        mock_get.return_value = _mock_response()
         
         fetch_weather(api_key="test_key", units="imperial")
         
-        call_args = mock_get.call_args
-        assert call_args[1]["params"]["units"] == "imperial"
+        assert _sent_params(mock_get)["units"] == "imperial"
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_invalid_json(self, mock_get):
+        """Test fetch weather with a body that is not valid JSON."""
+        mock_get.return_value = _mock_response(body=b"<html>Bad Gateway</html>")
+        
+        with pytest.raises(WeatherAPIError) as exc_info:
+            fetch_weather(api_key="test_key")
+        assert "Unexpected API response format" in str(exc_info.value)
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_streams_and_closes_response(self, mock_get):
+        """Test that the response is streamed and released after reading."""
+        mock_response = _mock_response()
+        mock_get.return_value = mock_response
+        
+        fetch_weather(api_key="test_key")
+        
+        assert mock_get.call_args[1]["stream"] is True
+        mock_response.close.assert_called_once()
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_decodes_bytes_without_charset_detection(self, mock_get):
+        """Test that the body is decoded from bytes, not via response.json()/.text."""
+        mock_response = _mock_response()
+        mock_get.return_value = mock_response
+        
+        fetch_weather(api_key="test_key")
+        
+        mock_response.json.assert_not_called()
+        assert "gzip" in weather._SESSION.headers["Accept-Encoding"]
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_oversized_body(self, mock_get):
+        """Test that a body larger than MAX_RESPONSE_BYTES is rejected."""
+        mock_response = _mock_response(body=b" " * (MAX_RESPONSE_BYTES + 1))
+        mock_get.return_value = mock_response
+        
+        with pytest.raises(WeatherAPIError) as exc_info:
+            fetch_weather(api_key="test_key")
+        assert "Response exceeds" in str(exc_info.value)
+        mock_response.close.assert_called_once()
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_oversized_content_length(self, mock_get):
+        """Test that an oversized Content-Length is rejected before reading."""
+        mock_response = _mock_response(
+            headers={"Content-Length": str(MAX_RESPONSE_BYTES + 1)}
+        )
+        mock_get.return_value = mock_response
+        
+        with pytest.raises(WeatherAPIError) as exc_info:
+            fetch_weather(api_key="test_key")
+        assert "Response exceeds" in str(exc_info.value)
+        mock_response.iter_content.assert_not_called()
+    
+    def test_session_reuses_pooled_connections(self):
+        """Test that the shared session keeps a bounded keep-alive pool for the API host."""
+        adapter = weather._SESSION.get_adapter(OPENWEATHER_API_BASE_URL)
+        
+        assert adapter._pool_maxsize == weather._POOL_MAXSIZE
+        assert adapter.max_retries.total == 0
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_non_object_body(self, mock_get):
+        """Test that a JSON body that is not an object raises WeatherAPIError."""
+        for body in (b"[]", b"null"):
+            mock_get.return_value = _mock_response(body=body)
+            
+            with pytest.raises(WeatherAPIError) as exc_info:
+                fetch_weather(api_key="test_key")
+            assert "Unexpected API response format" in str(exc_info.value)
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_malformed_content_length(self, mock_get):
+        """Test that an unparseable Content-Length falls back to counting bytes."""
+        mock_get.return_value = _mock_response(headers={"Content-Length": "10, 10"})
+        
+        result = fetch_weather(api_key="test_key")
+        
+        assert result.description == "clear sky"
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_malformed_content_length_oversized_body(self, mock_get):
+        """Test that the byte limit still applies when Content-Length is unparseable."""
+        mock_get.return_value = _mock_response(
+            body=b" " * (MAX_RESPONSE_BYTES + 1),
+            headers={"Content-Length": "10, 10"}
+        )
+        
+        with pytest.raises(WeatherAPIError) as exc_info:
+            fetch_weather(api_key="test_key")
+        assert "Response exceeds" in str(exc_info.value)
     
     def test_fetch_weather_empty_api_key(self):
         """Test fetch weather with empty API key."""
@@ -166,7 +388,7 @@ class TestFetchWeather:
             fetch_weather(api_key="")
         assert "API key cannot be empty" in str(exc_info.value)
     
-    @patch("tokyoweather.weather.requests.get")
+    @patch("tokyoweather.weather._SESSION.get")
     def test_fetch_weather_timeout(self, mock_get):
         """Test fetch weather with timeout."""
         mock_get.side_effect = requests.exceptions.Timeout()
@@ -175,7 +397,34 @@ class TestFetchWeather:
             fetch_weather(api_key="test_key")
         assert "timed out" in str(exc_info.value)
     
-    @patch("tokyoweather.weather.requests.get")
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_default_timeout(self, mock_get):
+        """Test that connect and read timeouts are set separately by default."""
+        mock_get.return_value = _mock_response()
+        
+        fetch_weather(api_key="test_key")
+        
+        assert mock_get.call_args[1]["timeout"] == DEFAULT_TIMEOUT
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_read_timeout_message(self, mock_get):
+        """Test that a read timeout reports the read budget."""
+        mock_get.side_effect = requests.exceptions.ReadTimeout()
+        
+        with pytest.raises(WeatherAPIError) as exc_info:
+            fetch_weather(api_key="test_key", timeout=(2.0, 7.0))
+        assert str(exc_info.value) == "Request timed out after 7.0 seconds"
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_connect_timeout(self, mock_get):
+        """Test that a connect timeout is reported separately from a read timeout."""
+        mock_get.side_effect = requests.exceptions.ConnectTimeout()
+        
+        with pytest.raises(WeatherAPIError) as exc_info:
+            fetch_weather(api_key="test_key", timeout=(2.0, 7.0))
+        assert str(exc_info.value) == "Connection timed out after 2.0 seconds"
+    
+    @patch("tokyoweather.weather._SESSION.get")
     def test_fetch_weather_connection_error(self, mock_get):
         """Test fetch weather with connection error."""
         mock_get.side_effect = requests.exceptions.ConnectionError()
@@ -184,43 +433,37 @@ class TestFetchWeather:
             fetch_weather(api_key="test_key")
         assert "Failed to connect" in str(exc_info.value)
     
-    @patch("tokyoweather.weather.requests.get")
+    @patch("tokyoweather.weather._SESSION.get")
     def test_fetch_weather_invalid_api_key(self, mock_get):
         """Test fetch weather with invalid API key (401)."""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _mock_response(status_code=401, reason="Unauthorized")
         
         with pytest.raises(WeatherAPIError) as exc_info:
             fetch_weather(api_key="invalid_key")
         assert "Invalid API key" in str(exc_info.value)
     
-    @patch("tokyoweather.weather.requests.get")
+    @patch("tokyoweather.weather._SESSION.get")
     def test_fetch_weather_city_not_found(self, mock_get):
         """Test fetch weather with city not found (404)."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _mock_response(status_code=404, reason="Not Found")
         
         with pytest.raises(WeatherAPIError) as exc_info:
             fetch_weather(api_key="test_key", city="InvalidCity")
         assert "not found" in str(exc_info.value)
     
-    @patch("tokyoweather.weather.requests.get")
+    @patch("tokyoweather.weather._SESSION.get")
     def test_fetch_weather_http_error(self, mock_get):
         """Test fetch weather with general HTTP error."""
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("Server Error")
+        mock_response = _mock_response(status_code=500, reason="Internal Server Error")
         mock_get.return_value = mock_response
         
         with pytest.raises(WeatherAPIError) as exc_info:
             fetch_weather(api_key="test_key")
-        assert "HTTP error" in str(exc_info.value)
+        assert str(exc_info.value) == "HTTP error: 500 Internal Server Error"
+        mock_response.iter_content.assert_not_called()
+        mock_response.close.assert_called_once()
     
-    @patch("tokyoweather.weather.requests.get")
+    @patch("tokyoweather.weather._SESSION.get")
     def test_fetch_weather_request_exception(self, mock_get):
         """Test fetch weather with general request exception."""
         mock_get.side_effect = requests.exceptions.RequestException("Unknown error")
@@ -229,15 +472,211 @@ class TestFetchWeather:
             fetch_weather(api_key="test_key")
         assert "Request failed" in str(exc_info.value)
     
-    @patch("tokyoweather.weather.requests.get")
+    @patch("tokyoweather.weather._SESSION.get")
     def test_fetch_weather_custom_timeout(self, mock_get):
         """Test fetch weather respects custom timeout parameter."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = deepcopy(SAMPLE_API_RESPONSE)
-        mock_get.return_value = mock_response
+        mock_get.return_value = _mock_response()
         
         fetch_weather(api_key="test_key", timeout=30)
         
         call_args = mock_get.call_args
         assert call_args[1]["timeout"] == 30
+
+
+class TestFetchWeatherCache:
+    """Tests for the fetch_weather result cache."""
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_repeated_fetch_uses_cache(self, mock_get):
+        """Test that a second call within the TTL does not hit the API."""
+        mock_get.return_value = _mock_response()
+        
+        first = fetch_weather(api_key="test_key")
+        second = fetch_weather(api_key="test_key")
+        
+        assert second is first
+        mock_get.assert_called_once()
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_cache_is_keyed_by_city_and_units(self, mock_get):
+        """Test that different cities and units are fetched separately."""
+        mock_get.return_value = _mock_response()
+        
+        fetch_weather(api_key="test_key")
+        fetch_weather(api_key="test_key", city="Osaka")
+        fetch_weather(api_key="test_key", units="imperial")
+        
+        assert mock_get.call_count == 3
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_cache_is_keyed_by_api_key(self, mock_get):
+        """Test that a different API key misses the cache and sees its own error."""
+        mock_get.side_effect = [
+            _mock_response(),
+            _mock_response(status_code=401, reason="Unauthorized")
+        ]
+        
+        fetch_weather(api_key="good_key")
+        with pytest.raises(WeatherAPIError) as exc_info:
+            fetch_weather(api_key="revoked_key")
+        
+        assert str(exc_info.value) == "Invalid API key"
+        assert mock_get.call_count == 2
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_lean_results_are_cached_separately(self, mock_get):
+        """Test that lean and full results do not share a cache entry."""
+        mock_get.return_value = _mock_response()
+        
+        full = fetch_weather(api_key="test_key")
+        lean = fetch_weather(api_key="test_key", lean=True)
+        
+        assert full.raw_data is not None
+        assert lean.raw_data is None
+        assert mock_get.call_count == 2
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_force_refresh_bypasses_cache(self, mock_get):
+        """Test that force_refresh always queries the API."""
+        mock_get.return_value = _mock_response()
+        
+        fetch_weather(api_key="test_key")
+        fetch_weather(api_key="test_key", force_refresh=True)
+        
+        assert mock_get.call_count == 2
+    
+    @patch("tokyoweather.weather.time.monotonic")
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_cache_entry_expires(self, mock_get, mock_monotonic):
+        """Test that entries older than the TTL are fetched again."""
+        mock_get.return_value = _mock_response()
+        mock_monotonic.return_value = 1000.0
+        fetch_weather(api_key="test_key")
+        
+        mock_monotonic.return_value = 1000.0 + weather._CACHE_TTL
+        fetch_weather(api_key="test_key")
+        
+        assert mock_get.call_count == 2
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_clear_weather_cache(self, mock_get):
+        """Test that clearing the cache forces the next call to hit the API."""
+        mock_get.return_value = _mock_response()
+        
+        fetch_weather(api_key="test_key")
+        clear_weather_cache()
+        fetch_weather(api_key="test_key")
+        
+        assert mock_get.call_count == 2
+    
+    @patch("tokyoweather.weather._CACHE_MAXSIZE", 2)
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_refreshed_entry_is_not_evicted_next(self, mock_get):
+        """Test that refreshing an entry moves it to the back of the eviction order."""
+        mock_get.return_value = _mock_response()
+        fetch_weather(api_key="test_key", city="Tokyo")
+        fetch_weather(api_key="test_key", city="Osaka")
+        
+        fetch_weather(api_key="test_key", city="Tokyo", force_refresh=True)
+        fetch_weather(api_key="test_key", city="Kyoto")
+        
+        cached_cities = [key[1] for key in weather._CACHE]
+        assert cached_cities == ["Tokyo", "Kyoto"]
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_errors_are_not_cached(self, mock_get):
+        """Test that a failed request is retried on the next call."""
+        mock_get.side_effect = [requests.exceptions.ConnectionError(), _mock_response()]
+        
+        with pytest.raises(WeatherAPIError):
+            fetch_weather(api_key="test_key")
+        result = fetch_weather(api_key="test_key")
+        
+        assert result.description == "clear sky"
+        assert mock_get.call_count == 2
+
+
+class TestFetchWeatherAsync:
+    """Tests for fetch_weather_async function."""
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_async_success(self, mock_get):
+        """Test that the async variant returns parsed weather data."""
+        mock_get.return_value = _mock_response()
+        
+        result = asyncio.run(fetch_weather_async(api_key="test_key", city="Osaka"))
+        
+        assert isinstance(result, WeatherData)
+        assert result.description == "clear sky"
+        assert _sent_params(mock_get)["q"] == "Osaka"
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_async_error(self, mock_get):
+        """Test that failures are raised as WeatherAPIError."""
+        mock_get.side_effect = requests.exceptions.Timeout()
+        
+        with pytest.raises(WeatherAPIError) as exc_info:
+            asyncio.run(fetch_weather_async(api_key="test_key"))
+        assert "timed out" in str(exc_info.value)
+
+
+class TestFetchWeatherMany:
+    """Tests for fetch_weather_many function."""
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_many_preserves_order(self, mock_get):
+        """Test that results are returned in the order of the cities given."""
+        def respond(*args, **kwargs):
+            data = json.loads(SAMPLE_API_RESPONSE_JSON)
+            city = _query_params(args, kwargs)["q"]
+            data["weather"][0]["description"] = f"sky over {city}"
+            return _mock_response(body=json.dumps(data).encode())
+        mock_get.side_effect = respond
+        
+        results = asyncio.run(
+            fetch_weather_many(api_key="test_key", cities=["Tokyo", "Osaka", "Sapporo"])
+        )
+        
+        assert [r.description for r in results] == [
+            "sky over Tokyo", "sky over Osaka", "sky over Sapporo"
+        ]
+        assert mock_get.call_count == 3
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_many_overlaps_requests(self, mock_get):
+        """Test that the requests for all cities are in flight at the same time."""
+        cities = ["Tokyo", "Osaka", "Sapporo", "Fukuoka"]
+        # Every request waits until all of them have started
+        barrier = threading.Barrier(len(cities), timeout=5)
+        
+        def respond(*args, **kwargs):
+            barrier.wait()
+            return _mock_response()
+        mock_get.side_effect = respond
+        
+        results = asyncio.run(fetch_weather_many(api_key="test_key", cities=cities))
+        
+        assert len(results) == len(cities)
+    
+    def test_fetch_weather_many_no_cities(self):
+        """Test that an empty city list returns an empty result."""
+        assert asyncio.run(fetch_weather_many(api_key="test_key", cities=[])) == []
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_many_propagates_errors(self, mock_get):
+        """Test that a failure for any city raises WeatherAPIError."""
+        mock_get.side_effect = requests.exceptions.ConnectionError()
+        
+        with pytest.raises(WeatherAPIError) as exc_info:
+            asyncio.run(fetch_weather_many(api_key="test_key", cities=["Tokyo", "Osaka"]))
+        assert "Failed to connect" in str(exc_info.value)
+    
+    @patch("tokyoweather.weather._SESSION.get")
+    def test_fetch_weather_many_sync(self, mock_get):
+        """Test the blocking wrapper returns one result per city."""
+        mock_get.return_value = _mock_response()
+        
+        results = fetch_weather_many_sync(api_key="test_key", cities=["Tokyo", "Osaka"])
+        
+        assert len(results) == 2
+        assert all(isinstance(r, WeatherData) for r in results)
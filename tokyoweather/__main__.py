@@ -9,39 +9,73 @@ and weather information. Run with: python -m tokyoweather
 import os
 import sys
 from dotenv import load_dotenv
-from .weather import fetch_weather, WeatherAPIError
 from .time_utils import format_jst_time
 
+# Bound on first use in main() so the missing-key path never imports requests
+fetch_weather = None
 
-def main():
+# Set once the .env file has been loaded, so repeated main() calls skip it
+_DOTENV_LOADED = False
+
+
+def _get_api_key():
+    """
+    Read the OpenWeatherMap API key from the environment.
+    
+    Returns:
+        str: The stripped API key, or an empty string if unset or blank.
+    """
+    return (os.getenv("OPENWEATHER_API_KEY") or "").strip()
+
+
+def main(argv=None):
     """
     Main CLI function to display Tokyo time and weather.
     
+    Args:
+        argv (list, optional): Command-line arguments. If None, uses sys.argv[1:].
+                               Pass "--json" to print only the weather as JSON.
+    
     Exit codes:
         0: Success
         1: Configuration error (missing API key)
         2: Network/API failure
     """
-    # Load environment variables from .env file if it exists
-    load_dotenv()
+    global fetch_weather, _DOTENV_LOADED
     
-    # Display current JST time
-    print(f"Tokyo Time: {format_jst_time()}")
+    if argv is None:
+        argv = sys.argv[1:]
+    as_json = "--json" in argv
     
-    # Get API key from environment
-    api_key = os.getenv("OPENWEATHER_API_KEY")
+    # Load environment variables from .env file if it exists (once per process)
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
     
-    # Validate API key is not empty or whitespace-only
-    if not api_key or not api_key.strip():
+    # Display current JST time (JSON mode keeps stdout machine-readable)
+    if not as_json:
+        print(f"Tokyo Time: {format_jst_time()}")
+    
+    # Get API key from environment (whitespace-only is treated as missing)
+    api_key = _get_api_key()
+    if not api_key:
         print("ERROR: OPENWEATHER_API_KEY environment variable not set.", file=sys.stderr)
         print("Please set your API key:", file=sys.stderr)
         print("  export OPENWEATHER_API_KEY=your_api_key_here", file=sys.stderr)
         return 1
     
+    # Import the weather client only once it is actually needed
+    from .weather import WeatherAPIError
+    if fetch_weather is None:
+        from .weather import fetch_weather
+    
     # Fetch and display weather data
     try:
         weather_data = fetch_weather(api_key=api_key)
-        print(weather_data)
+        if as_json:
+            print(weather_data.to_json().decode())
+        else:
+            print(weather_data)
         return 0
     except WeatherAPIError as e:
         print(f"ERROR: Failed to fetch weather data: {e}", file=sys.stderr)
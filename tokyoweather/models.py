@@ -2,11 +2,19 @@
 Data models for weather API responses.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
+try:
+    from orjson import dumps as _json_dumps
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    import json
+    
+    def _json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WeatherData:
     """
     Data class representing weather information.
@@ -16,13 +24,14 @@ class WeatherData:
         temperature: Temperature in Celsius
         humidity: Humidity percentage
         wind_speed: Wind speed in m/s
-        raw_data: Optional raw API response data
+        raw_data: Optional raw API response data, kept for diagnostics only;
+                  it is excluded from repr() and equality/hashing
     """
     description: str
     temperature: float
     humidity: int
     wind_speed: float
-    raw_data: Optional[dict] = None
+    raw_data: Optional[dict] = field(default=None, repr=False, compare=False)
     
     def __str__(self):
         """Human-readable string representation."""
@@ -32,3 +41,18 @@ class WeatherData:
             f"Humidity: {self.humidity} %\n"
             f"Wind: {self.wind_speed} m/s"
         )
+    
+    def to_json(self) -> bytes:
+        """
+        Serialize the weather fields (without raw_data) as UTF-8 JSON.
+        
+        Returns:
+            bytes: Compact JSON object with description, temperature,
+                   humidity and wind_speed
+        """
+        return _json_dumps({
+            "description": self.description,
+            "temperature": self.temperature,
+            "humidity": self.humidity,
+            "wind_speed": self.wind_speed,
+        })
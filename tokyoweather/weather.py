@@ -2,14 +2,61 @@
 Weather API client for fetching Tokyo weather information.
 """
 
+import asyncio
+import threading
+import time
+from functools import lru_cache
+from operator import itemgetter
+from urllib.parse import quote, urlencode
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from typing import Iterable, List, Optional, Tuple, Union
 from .models import WeatherData
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; the stdlib decoder also accepts bytes
+    from json import loads as _json_loads
+
 
 OPENWEATHER_API_BASE_URL = "https://api.openweathermap.org/data/2.5/weather"
 DEFAULT_CITY = "Tokyo"
 DEFAULT_UNITS = "metric"  # Celsius for temperature, m/s for wind
+# (connect, read) seconds: fail fast on DNS/TCP problems, allow a slow response
+DEFAULT_TIMEOUT = (3.0, 10.0)
+MAX_RESPONSE_BYTES = 64 * 1024  # a current-weather payload is well under 2 KB
+_TOO_LARGE_MESSAGE = f"Response exceeds {MAX_RESPONSE_BYTES} bytes"
+
+# Fetches ("temp", "humidity") from the "main" object in a single C call
+_MAIN_FIELDS = itemgetter("temp", "humidity")
+
+# Error messages for HTTP status codes with a specific meaning for this API
+_STATUS_MESSAGES = {
+    401: "Invalid API key",
+    404: "City '{city}' not found",
+}
+_DEFAULT_STATUS_MESSAGE = "HTTP error: {status} {reason}"
+
+# Shared session so repeated calls reuse keep-alive connections. All requests
+# go to a single host, so one connection pool is enough; failed requests are
+# reported, not retried. fetch_weather_many runs each fetch on asyncio's
+# default executor, which never has more than 32 worker threads, so a pool
+# of that size gives every in-flight request a keep-alive connection.
+# Connections are opened lazily, so unused slots cost nothing.
+_POOL_MAXSIZE = 32
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=_POOL_MAXSIZE,
+    max_retries=0
+))
+
+# In-process cache of parsed results:
+# (api_key, city, units, lean) -> (monotonic time, WeatherData)
+_CACHE_TTL = 300.0  # seconds; OpenWeatherMap updates current weather every few minutes
+_CACHE_MAXSIZE = 64
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
 
 
 class WeatherAPIError(Exception):
@@ -21,16 +68,26 @@ def fetch_weather(
     api_key: str,
     city: str = DEFAULT_CITY,
     units: str = DEFAULT_UNITS,
-    timeout: int = 10
+    timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT,
+    force_refresh: bool = False,
+    lean: bool = False
 ) -> WeatherData:
     """
     Fetch current weather data from OpenWeatherMap API.
     
+    Successful results are cached in-process per (api_key, city, units, lean)
+    for _CACHE_TTL seconds; failed requests are never cached. Cache hits
+    return the same WeatherData instance, so treat raw_data as read-only.
+    
     Args:
         api_key: OpenWeatherMap API key
         city: City name (default: "Tokyo")
         units: Unit system - "metric", "imperial", or "standard" (default: "metric")
-        timeout: Request timeout in seconds (default: 10)
+        timeout: Request timeout in seconds, either a single value or a
+                 (connect, read) tuple (default: (3.0, 10.0))
+        force_refresh: Bypass the cache and always query the API (default: False)
+        lean: Drop the decoded payload instead of keeping it as raw_data,
+              so only the four weather fields stay in memory (default: False)
     
     Returns:
         WeatherData: Structured weather information
@@ -41,42 +98,198 @@ def fetch_weather(
     if not api_key:
         raise WeatherAPIError("API key cannot be empty")
     
-    params = {
-        "q": city,
-        "appid": api_key,
-        "units": units
-    }
+    # The API key is part of the key so a wrong or revoked key still gets a 401
+    cache_key = (api_key, city, units, lean)
+    if not force_refresh:
+        entry = _CACHE.get(cache_key)
+        if entry is not None and time.monotonic() - entry[0] < _CACHE_TTL:
+            return entry[1]
+    
+    # Only the API key is encoded per call; it is never part of the URL cache
+    url = _build_url(city, units) + "&appid=" + quote(api_key, safe="")
     
     try:
-        response = requests.get(
-            OPENWEATHER_API_BASE_URL,
-            params=params,
-            timeout=timeout
+        response = _SESSION.get(
+            url,
+            timeout=timeout,
+            stream=True
         )
-        response.raise_for_status()
+        try:
+            if response.status_code >= 400:
+                message = _STATUS_MESSAGES.get(response.status_code, _DEFAULT_STATUS_MESSAGE)
+                raise WeatherAPIError(message.format(
+                    city=city, status=response.status_code, reason=response.reason
+                ).rstrip())
+            body = _read_body(response)
+        finally:
+            response.close()
+    except requests.exceptions.ConnectTimeout:
+        connect_timeout = timeout[0] if isinstance(timeout, tuple) else timeout
+        raise WeatherAPIError(f"Connection timed out after {connect_timeout} seconds")
     except requests.exceptions.Timeout:
-        raise WeatherAPIError(f"Request timed out after {timeout} seconds")
+        read_timeout = timeout[1] if isinstance(timeout, tuple) else timeout
+        raise WeatherAPIError(f"Request timed out after {read_timeout} seconds")
     except requests.exceptions.ConnectionError:
         raise WeatherAPIError("Failed to connect to weather service")
-    except requests.exceptions.HTTPError as e:
-        if response.status_code == 401:
-            raise WeatherAPIError("Invalid API key")
-        elif response.status_code == 404:
-            raise WeatherAPIError(f"City '{city}' not found")
-        else:
-            raise WeatherAPIError(f"HTTP error: {e}")
     except requests.exceptions.RequestException as e:
         raise WeatherAPIError(f"Request failed: {e}")
     
-    return _parse_weather_response(response.json())
+    try:
+        data = _json_loads(body)
+    except ValueError as e:
+        raise WeatherAPIError(f"Unexpected API response format: {e}")
+    
+    result = _parse_weather_response(data, keep_raw=not lean)
+    with _CACHE_LOCK:
+        # Re-insert refreshed keys so they move to the end of the eviction order
+        _CACHE.pop(cache_key, None)
+        if len(_CACHE) >= _CACHE_MAXSIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            del _CACHE[next(iter(_CACHE))]
+        _CACHE[cache_key] = (time.monotonic(), result)
+    return result
+
+
+def _read_body(response: requests.Response) -> bytes:
+    """
+    Read a streamed response body, aborting once it exceeds MAX_RESPONSE_BYTES.
+    
+    Args:
+        response: Response returned by a ``stream=True`` request
+    
+    Returns:
+        bytes: The (decompressed) response body
+    
+    Raises:
+        WeatherAPIError: If the body is larger than MAX_RESPONSE_BYTES
+    """
+    try:
+        content_length = int(response.headers.get("Content-Length") or 0)
+    except ValueError:
+        # Malformed or merged header (e.g. "10, 10"); rely on the byte count below
+        content_length = 0
+    if content_length > MAX_RESPONSE_BYTES:
+        raise WeatherAPIError(_TOO_LARGE_MESSAGE)
+    
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=8192):
+        body += chunk
+        if len(body) > MAX_RESPONSE_BYTES:
+            raise WeatherAPIError(_TOO_LARGE_MESSAGE)
+    return bytes(body)
+
+
+def clear_weather_cache() -> None:
+    """Discard all cached fetch_weather results."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+@lru_cache(maxsize=64)
+def _build_url(city: str, units: str) -> str:
+    """
+    Build the request URL, without the API key, for a city/units pair.
+    
+    Memoized so each distinct pair is URL-encoded only once.
+    """
+    return OPENWEATHER_API_BASE_URL + "?" + urlencode({"q": city, "units": units})
+
+
+async def fetch_weather_async(
+    api_key: str,
+    city: str = DEFAULT_CITY,
+    units: str = DEFAULT_UNITS,
+    timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT
+) -> WeatherData:
+    """
+    Fetch current weather data without blocking the event loop.
+    
+    Runs fetch_weather() in a worker thread, so it shares the module's
+    connection pool and result cache with the synchronous API.
+    
+    Args:
+        api_key: OpenWeatherMap API key
+        city: City name (default: "Tokyo")
+        units: Unit system - "metric", "imperial", or "standard" (default: "metric")
+        timeout: Request timeout in seconds, either a single value or a
+                 (connect, read) tuple (default: (3.0, 10.0))
+    
+    Returns:
+        WeatherData: Structured weather information
+    
+    Raises:
+        WeatherAPIError: If the API request fails or returns invalid data
+    """
+    return await asyncio.to_thread(fetch_weather, api_key, city, units, timeout)
 
 
-def _parse_weather_response(data: dict) -> WeatherData:
+async def fetch_weather_many(
+    api_key: str,
+    cities: Iterable[str],
+    units: str = DEFAULT_UNITS,
+    timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT
+) -> List[WeatherData]:
+    """
+    Fetch current weather data for several cities concurrently.
+    
+    Each city is fetched with fetch_weather_async(), so the round-trips
+    overlap while sharing the module's connection pool.
+    
+    Args:
+        api_key: OpenWeatherMap API key
+        cities: City names to fetch
+        units: Unit system - "metric", "imperial", or "standard" (default: "metric")
+        timeout: Request timeout in seconds for each city, either a single
+                 value or a (connect, read) tuple (default: (3.0, 10.0))
+    
+    Returns:
+        list[WeatherData]: Weather information in the same order as cities
+    
+    Raises:
+        WeatherAPIError: If any of the requests fails
+    """
+    results = await asyncio.gather(*(
+        fetch_weather_async(api_key, city, units, timeout)
+        for city in cities
+    ))
+    return list(results)
+
+
+def fetch_weather_many_sync(
+    api_key: str,
+    cities: Iterable[str],
+    units: str = DEFAULT_UNITS,
+    timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT
+) -> List[WeatherData]:
+    """
+    Blocking wrapper around fetch_weather_many() for non-async callers.
+    
+    Must not be called from a running event loop; await
+    fetch_weather_many() there instead.
+    
+    Args:
+        api_key: OpenWeatherMap API key
+        cities: City names to fetch
+        units: Unit system - "metric", "imperial", or "standard" (default: "metric")
+        timeout: Request timeout in seconds for each city, either a single
+                 value or a (connect, read) tuple (default: (3.0, 10.0))
+    
+    Returns:
+        list[WeatherData]: Weather information in the same order as cities
+    
+    Raises:
+        WeatherAPIError: If any of the requests fails
+    """
+    return asyncio.run(fetch_weather_many(api_key, cities, units, timeout))
+
+
+def _parse_weather_response(data: dict, keep_raw: bool = True) -> WeatherData:
     """
     Parse OpenWeatherMap API response into WeatherData object.
     
     Args:
         data: JSON response from OpenWeatherMap API
+        keep_raw: Store data as WeatherData.raw_data (default: True)
     
     Returns:
         WeatherData: Structured weather information
@@ -84,14 +297,18 @@ def _parse_weather_response(data: dict) -> WeatherData:
     Raises:
         WeatherAPIError: If the response format is unexpected
     """
+    if not isinstance(data, dict):
+        raise WeatherAPIError("Unexpected API response format: expected a JSON object")
+    
+    weather_list = data.get("weather")
+    if not weather_list:
+        raise WeatherAPIError("Unexpected API response format: weather list is empty")
+    
+    # Only malformed payloads raise below; entering the try block is
+    # effectively free on the happy path (zero-cost on Python 3.11+)
     try:
-        weather_list = data.get("weather", [])
-        if not weather_list:
-            raise KeyError("weather list is empty")
-        
         description = weather_list[0]["description"]
-        temperature = data["main"]["temp"]
-        humidity = data["main"]["humidity"]
+        temperature, humidity = _MAIN_FIELDS(data["main"])
         wind_speed = data["wind"]["speed"]
         
         return WeatherData(
@@ -99,7 +316,9 @@ def _parse_weather_response(data: dict) -> WeatherData:
             temperature=round(temperature, 1),
             humidity=humidity,
             wind_speed=round(wind_speed, 1),
-            raw_data=data
+            raw_data=data if keep_raw else None
         )
-    except (KeyError, IndexError, TypeError) as e:
+    except KeyError as e:
+        raise WeatherAPIError(f"Unexpected API response format: missing field {e}")
+    except TypeError as e:
         raise WeatherAPIError(f"Unexpected API response format: {e}")